@@ -1,4 +1,6 @@
 import asyncio
+import functools
+import inspect
 import json
 import logging
 import os
@@ -6,18 +8,22 @@ import sys
 import signal
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
 
 # Third-party imports
 import discord 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.combining import OrTrigger
 from apscheduler.triggers.cron import CronTrigger
 from discord import Embed
 from discord.ext import commands
 
 # Local utility imports
-from utils.config_utils import (load_config, 
+from utils.logging_setup import stop_logging
+from utils.config_utils import (load_config, setup_logging, 
     DISCORD_TOKEN, EXCEL_FILE_MAIN, ACCOUNT_MAPPING, WATCH_FILE,
     DISCORD_PRIMARY_CHANNEL, DISCORD_SECONDARY_CHANNEL,
     HOLDINGS_LOG_CSV, ORDERS_LOG_CSV, SQL_DATABASE_DB, VERSION
@@ -34,17 +40,19 @@ from utils.sql_utils import get_db_connection, init_db, bot_query_table
 from utils.csv_utils import clear_holdings_log, send_top_holdings_embed
 from utils.utility_utils import (all_account_nicknames, all_brokers,
                                  generate_broker_summary_embed,
-                                 print_to_discord, track_ticker_summary,
+                                 print_to_discord, send_embeds, track_ticker_summary,
                                  update_file_version, get_file_version)
-from utils.watch_utils import (list_watched_tickers,
-                               periodic_check, send_reminder_message_embed,
+from utils.watch_utils import (is_valid_split_ratio, list_watched_tickers, parse_split_date,
+                               send_reminder_message_embed,
                                stop_watching, watch_ratio, watch_ticker)
 
 bot_info = (f'RSAssistant - v{VERSION} by @braydio \n    <https://github.com/braydio/RSAssistant> \n \n ')
 
-init_db()
 config = load_config()
 
+# Reminders follow market hours, so they are scheduled in the market's timezone
+SCHEDULER_TIMEZONE = ZoneInfo(config.get("general_settings", {}).get("timezone", "America/New_York"))
+
 CONFIG_TOKEN = "ERROR : Cannot locate critical environment variable  : BOT_TOKEN" # config["discord"]["token"]
 CONFIG_CHANNEL_PRIMARY = "ERROR : Cannot locate critical environment variable  : DISCORD PRIMARY CHANNEL" # config["discord"]['channel_id']
 CONFIG_CHANNEL_SECONDARY = "ERROR : Cannot locate critical environment variable  : DISCORD SECONDARY CHANNEL" # config["discord"]['channel_id2']
@@ -54,33 +62,89 @@ TARGET_CHANNEL_ID = DISCORD_PRIMARY_CHANNEL
 ALERTS_CHANNEL_ID = DISCORD_SECONDARY_CHANNEL
 BOT_TOKEN = DISCORD_TOKEN
 
-logging.info(f"Environment Variables loaded from dotenv : BOT_TOKEN {BOT_TOKEN}, PRIMARY CHANNEL ID {DISCORD_PRIMARY_CHANNEL}, SECONDARY CHANNEL ID {DISCORD_SECONDARY_CHANNEL}")
+logging.info(
+    "Environment Variables loaded from dotenv : BOT_TOKEN %s, PRIMARY CHANNEL ID %s, SECONDARY CHANNEL ID %s",
+    "set" if BOT_TOKEN else "missing", DISCORD_PRIMARY_CHANNEL, DISCORD_SECONDARY_CHANNEL,
+)
 
-logging.info(f"Holdings Log CSV file: {HOLDINGS_LOG_CSV}")
-logging.info(f"Orders Log CSV file: {ORDERS_LOG_CSV}")
+logging.info("Holdings Log CSV file: %s", HOLDINGS_LOG_CSV)
+logging.info("Orders Log CSV file: %s", ORDERS_LOG_CSV)
 
-# Set up bot intents
-intents = discord.Intents.default()
-intents.message_content = True
+# Set up bot intents: only guild messages are needed
+intents = discord.Intents.none()
 intents.guilds = True
-intents.members = True
+intents.guild_messages = True
+intents.message_content = True
+
+class RSAssistantBot(commands.Bot):
+    """Bot that prepares the database during login, before connecting to the gateway."""
+
+    async def setup_hook(self):
+        await asyncio.to_thread(init_db)
+
 
 # Initialize bot
-bot = commands.Bot(
-    command_prefix="..", case_insensitive=True, intents=intents
+bot = RSAssistantBot(
+    command_prefix="..",
+    case_insensitive=True,
+    intents=intents,
+    member_cache_flags=discord.MemberCacheFlags.none(),
+    chunk_guilds_at_startup=False,
+    max_messages=None,  # Message history is never read back
 )
 
-global periodic_task, reminder_scheduler
+# Background work started in on_ready
+reminder_scheduler = None
+alert_task = None
+
+# Parsed alerts waiting to be forwarded to the primary channel
+alert_queue = asyncio.Queue()
+ALERT_BATCH_SIZE = 10
+ALERT_BATCH_WINDOW = 0.5  # Seconds to wait for more alerts before sending
+
+# Order parsing writes the CSV logs and SQLite (and the Excel log via save_order_to_csv);
+# a single worker keeps messages in arrival order and is the only thread that writes holdings_log.csv
+parse_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parse")
+
+# Restarts re-execute the interpreter once bot.run has returned
+PYTHON_EXECUTABLE = sys.executable
+RESTART_ARGV = [sys.executable] + sys.argv
+restart_requested = False
+
+# Set once SIGINT/SIGTERM are routed through the event loop
+signal_handlers_installed = False
+shutdown_task = None
+shutting_down = False  # Makes shutdown run once, however it was triggered
+
+# Primary channel object, resolved once the bot is connected
+primary_channel = None
+
+
+def get_primary_channel():
+    """Returns the cached primary channel, resolving it if not yet cached."""
+    global primary_channel
+    if primary_channel is None:
+        primary_channel = bot.get_channel(TARGET_CHANNEL_ID)
+    return primary_channel
+
+
+def resolve_channels():
+    """Resolves and caches the primary channel object."""
+    global primary_channel
+    primary_channel = bot.get_channel(TARGET_CHANNEL_ID)
 
 @bot.event
 async def on_ready():
     """Triggered when the bot is ready."""
-    
+    global reminder_scheduler, alert_task
+
+    install_signal_handlers(asyncio.get_running_loop())
     await asyncio.sleep(2)
-    logging.info(f"RSAssistant by @braydio - GitHub: https://github.com/braydio/RSAssistant")
-    logging.info(f"Version {VERSION} | Runtime Environment: Production")
+    logging.info("RSAssistant by @braydio - GitHub: https://github.com/braydio/RSAssistant")
+    logging.info("Version %s | Runtime Environment: Production", VERSION)
     await asyncio.sleep(3)
-    channel = bot.get_channel(TARGET_CHANNEL_ID)
+    resolve_channels()
+    channel = primary_channel
     
     account_setup_message = f"\n\n**(╯°□°）╯**\n\n Account mappings not found. Please fill in Reverse Split Log > Account Details sheet at\n`{EXCEL_FILE_MAIN}`\n\nThen run: `..loadmap` and `..loadlog`."
     
@@ -95,80 +159,200 @@ async def on_ready():
         ready_message = account_setup_message
         
     if channel:
-        await channel.send(ready_message)
+        embed = Embed(title="RSAssistant Ready", description=ready_message)
+        embed.add_field(name="Time", value=datetime.now().strftime("%m-%d %H:%M"))
+        embed.add_field(name="Orders Log", value=f"`{ORDERS_LOG_CSV}`", inline=False)
+        embed.add_field(name="Holdings Log", value=f"`{HOLDINGS_LOG_CSV}`", inline=False)
+        await channel.send(embed=embed)
     else:
-        logging.warning(f"Target Channel not found - ID: {TARGET_CHANNEL_ID} on startup.")
+        logging.warning("Target Channel not found - ID: %s on startup.", TARGET_CHANNEL_ID)
 
-    logging.info(f"Initializing Application in Production environment.")
-    logging.info(f"{bot.user} has connected to Discord!")
+    logging.info("Initializing Application in Production environment.")
+    logging.info("%s has connected to Discord!", bot.user)
 
-    # Start periodic check task if not already running
-    if 'periodic_task' not in globals() or periodic_task is None:
-        periodic_task = asyncio.create_task(periodic_check(bot))
-        logging.info("Periodic task started.")
-    else:
-        logging.info("Periodic task already running.")
+    if alert_task is None or alert_task.done():
+        alert_task = asyncio.create_task(flush_alerts())
 
     # Schedule reminder task using APScheduler
-    if 'reminder_scheduler' not in globals() or reminder_scheduler is None:
-        reminder_scheduler = BackgroundScheduler()
-        reminder_scheduler.add_job(lambda: bot.loop.create_task(send_reminder_message_embed(bot)), CronTrigger(hour=8, minute=45))
-        reminder_scheduler.add_job(lambda: bot.loop.create_task(send_reminder_message_embed(bot)), CronTrigger(hour=15, minute=30))
+    if reminder_scheduler is None:
+        reminder_scheduler = AsyncIOScheduler(event_loop=bot.loop, timezone=SCHEDULER_TIMEZONE)
+        reminder_scheduler.add_job(
+            send_scheduled_reminder,
+            OrTrigger([
+                CronTrigger(hour=8, minute=45, timezone=SCHEDULER_TIMEZONE),
+                CronTrigger(hour=15, minute=30, timezone=SCHEDULER_TIMEZONE),
+            ]),
+            id="daily_reminder",
+            replace_existing=True,
+            misfire_grace_time=3600,
+            coalesce=True,
+        )
         reminder_scheduler.start()
-        logging.info("Scheduled reminders at 8:45 AM and 3:30 PM started.")
+        logging.info("Scheduled reminders at 8:45 AM and 3:30 PM (%s) started.", SCHEDULER_TIMEZONE.key)
     else:
         logging.info("Reminder scheduler already running.")
     category = "Startup and Shutdown"
 
+@bot.event
+async def on_resumed():
+    """Re-resolves cached channels after the gateway session resumes."""
+    resolve_channels()
+
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    """Drops the cached primary channel if that channel was deleted."""
+    global primary_channel
+    if channel.id == TARGET_CHANNEL_ID:
+        primary_channel = None
+
+def stop_background_tasks():
+    """Cancels the alert task and stops the reminder scheduler."""
+    global reminder_scheduler, alert_task
+    # Each step is guarded so one failure does not leave the rest running
+    try:
+        if alert_task is not None and not alert_task.done():
+            alert_task.cancel()
+    except Exception:
+        logging.exception("Error cancelling background task.")
+    alert_task = None
+    try:
+        if reminder_scheduler is not None and reminder_scheduler.running:
+            reminder_scheduler.shutdown(wait=False)
+    except Exception:
+        logging.exception("Error stopping reminder scheduler.")
+    reminder_scheduler = None
+
+
 @bot.command(name="restart")
 async def restart(ctx):
-    """Restarts the bot."""
-    await ctx.send("\n(・_・ヾ)     (-.-)Zzz...\nAYO WISEGUY THIS COMMAND IS BROKEN AND WILL BE DISRUPTIVE TO THE DISCORD BOT\nNICE WORK GENIUS")
-    await asyncio.sleep(1)
+    """Restarts the bot once the Discord connection has closed cleanly."""
+    global restart_requested
+    await ctx.send("\n(・_・ヾ)     (-.-)Zzz...\nRestarting, back in a moment.")
     logging.info("Attempting to restart the bot...")
     try:
-        python = sys.executable
-        os.execv(python, [python] + sys.argv)
+        stop_background_tasks()
+        restart_requested = True
+        await bot.close()  # bot.run returns and the process re-executes itself
     except Exception as e:
-        logging.error(f"Error during restart: {e}")
+        restart_requested = False
+        logging.error("Error during restart: %s", e)
         await ctx.send("An error occurred while attempting to restart the bot.")
 
+async def handle_primary_message(message):
+    """Parses order activity posted in the primary channel."""
+    if message.content[:6].lower() == "manual":
+        logging.warning("Manual order detected: %s", message.content)
+        # manual_order(message.content)
+    elif message.embeds:
+        await bot.loop.run_in_executor(parse_executor, parse_embed_message, message.embeds[0])
+    else:
+        await bot.loop.run_in_executor(parse_executor, parse_order_message, message.content)
+
+
+async def handle_secondary_message(message):
+    """Forwards corporate action alerts from the secondary channel."""
+    if message.content:
+        logging.info("Received message: %s", message.content)
+
+        parsed_message = alert_channel_message(message.content)
+
+        if parsed_message:
+            alert_queue.put_nowait(parsed_message)
+            logging.info("Alert queued for the primary channel.")
+        else:
+            logging.warning("Parsed message is None. No alert sent.")
+
+        # Optional notification
+        # await channel.send("Nasdaq Corporate Actions Alert: See channel #reverse-splits")
+
+
+async def flush_alerts():
+    """Forwards queued alerts to the primary channel, combining bursts into fewer sends."""
+    while True:
+        alerts = [await alert_queue.get()]
+        await asyncio.sleep(ALERT_BATCH_WINDOW)
+        while not alert_queue.empty() and len(alerts) < ALERT_BATCH_SIZE:
+            alerts.append(alert_queue.get_nowait())
+
+        channel = get_primary_channel()
+        if not channel:
+            logging.error("Target channel with ID %s not found, dropping %d alert(s).", TARGET_CHANNEL_ID, len(alerts))
+            continue
+
+        # Join alerts into as few messages as the 2000 character limit allows
+        chunks = [alerts[0][:2000]]
+        for alert in alerts[1:]:
+            if len(chunks[-1]) + len(alert) + 2 > 2000:
+                chunks.append(alert[:2000])
+            else:
+                chunks[-1] += f"\n\n{alert}"
+        try:
+            for chunk in chunks:
+                await channel.send(chunk)
+            logging.info("Sent %d alert(s) in %d message(s).", len(alerts), len(chunks))
+        except Exception as e:
+            logging.error("Error sending alerts: %s", e)
+
+
+# Message handlers keyed by channel ID
+CHANNEL_HANDLERS = {
+    TARGET_CHANNEL_ID: handle_primary_message,
+    ALERTS_CHANNEL_ID: handle_secondary_message,
+}
+
+
+# Bounds how many channel handlers run at once; tasks are referenced until done
+message_semaphore = asyncio.Semaphore(32)
+message_tasks = set()
+
+
+async def run_channel_handler(handler, message):
+    """Runs a channel handler under the semaphore, logging any failure."""
+    async with message_semaphore:
+        try:
+            await handler(message)
+        except Exception as e:
+            logging.error("Error handling message in channel %s: %s", message.channel.id, e)
+
+
 @bot.event
 async def on_message(message):
     """Triggered when a message is received in the target channel."""
     if message.author == bot.user:
         return  # Prevents the bot from responding to itself
 
-    # Check if the message was sent in the target channel
-    if message.channel.id == TARGET_CHANNEL_ID:
+    handler = CHANNEL_HANDLERS.get(message.channel.id)
+    if handler:
+        task = asyncio.create_task(run_channel_handler(handler, message))
+        message_tasks.add(task)
+        task.add_done_callback(message_tasks.discard)
 
-        if message.content.lower().startswith("manual"):
-            logging.warning(f"Manual order detected: {message.content}")
-            # manual_order(message.content)
-        elif message.embeds:
-            parse_embed_message(message.embeds[0])
-        else:
-            parse_order_message(message.content)
-    
-    if message.channel.id == ALERTS_CHANNEL_ID:
-        if message.content:
-            logging.info(f"Received message: {message.content}")
-            
-            channel = bot.get_channel(TARGET_CHANNEL_ID)
-            parsed_message = alert_channel_message(message.content)
-
-            if parsed_message:
-                await channel.send(f"\n{parsed_message}")
-                logging.info("Alert sent successfully.")
-            else:
-                logging.warning("Parsed message is None. No alert sent.")
+    # Pass the message to the command processing so bot commands work
+    await bot.process_commands(message)
 
-            # Optional notification
-            # await channel.send("Nasdaq Corporate Actions Alert: See channel #reverse-splits")
+def normalize_args(**rules):
+    """
+    Decorator that normalizes named command arguments before the command runs.
 
+    Example: @normalize_args(ticker=str.upper) uppercases the ticker argument.
+    The command signature is bound once at decoration time.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            for name, rule in rules.items():
+                if bound.arguments.get(name) is not None:
+                    bound.arguments[name] = rule(bound.arguments[name])
+            return await func(*bound.args, **bound.kwargs)
+
+        return wrapper
+
+    return decorator
 
-    # Pass the message to the command processing so bot commands work
-    await bot.process_commands(message)
 
 async def send_buy(ctx):
     order_details = "!ping"
@@ -183,11 +367,11 @@ async def show_reminder(ctx):
 
 async def send_scheduled_reminder():
     """Send scheduled reminders to the target channel."""
-    channel = bot.get_channel(TARGET_CHANNEL_ID)
+    channel = get_primary_channel()
     if channel:
         await send_reminder_message_embed(channel)
     else:
-        logging.error(f"Could not find channel with ID: {TARGET_CHANNEL_ID} to send reminder.")
+        logging.error("Could not find channel with ID: %s to send reminder.", TARGET_CHANNEL_ID)
 
 
 @bot.command(name="brokerlist", help="List all active brokers. Optional arg: Broker")
@@ -203,6 +387,7 @@ async def brokerlist(ctx, broker: str = None):
 
 
 @bot.command(name="brokerwith", help="All brokers with specified tickers > brokerwith <ticker> (details)",)
+@normalize_args(ticker=str.upper)
 async def broker_has(ctx, ticker: str, *args):
     """Shows broker-level summary for a specific ticker."""
     specific_broker = args[0] if args else None
@@ -245,20 +430,18 @@ async def top_holdings_command(ctx, range: int = 3):
 @bot.command(name="watch",
     help="Add ticker to watchlist. Args: split_date split_ratio format: 'mm/dd' 'r-r'",
 )
+@normalize_args(ticker=str.upper)
 async def watch(ctx, ticker: str, split_date: str = None, split_ratio: str = None):
     """Adds a ticker to the watchlist with an optional split date and split ratio."""
-    try:
-        if split_date:
-            datetime.strptime(split_date, "%m/%d")  # Validates the format as mm/dd
-    except ValueError:
-        await ctx.send("Invalid date format. Please use * mm/dd * e.g., 11/4.")
-        return
-
     if not split_date:
         await ctx.send("Please include split date: * mm/dd *")
         return
 
-    if split_ratio and not split_ratio.count("-") == 1:
+    if parse_split_date(split_date) is None:
+        await ctx.send("Invalid date format. Please use * mm/dd * e.g., 11/4.")
+        return
+
+    if split_ratio and not is_valid_split_ratio(split_ratio):
         await ctx.send("Invalid split ratio format. Use 'X-Y' format (e.g., 1-10).")
         return
 
@@ -268,6 +451,7 @@ async def watch(ctx, ticker: str, split_date: str = None, split_ratio: str = Non
 @bot.command(name="addratio",
     help="Adds or updates the split ratio for an existing ticker in the watchlist.",
 )
+@normalize_args(ticker=str.upper)
 async def add_ratio(ctx, ticker: str, split_ratio: str):
 
     if not split_ratio:
@@ -285,6 +469,7 @@ async def allwatching(ctx):
 
 
 @bot.command(name="watched", help="Removes a ticker from the watchlist.")
+@normalize_args(ticker=str.upper)
 async def watched_ticker(ctx, ticker: str):
     """Removes a ticker from the watchlist."""
     await stop_watching(ctx, ticker)
@@ -333,10 +518,24 @@ async def clear_mapping_command(ctx):
 @bot.command(name="clearholdings", help="Clears entries in holdings_log.csv")
 async def clear_holdings(ctx):
     """Clears all holdings from the CSV file."""
-    success, message = clear_holdings_log(HOLDINGS_LOG_CSV)
+    # Same worker as order parsing, so this never races save_holdings_to_csv
+    success, message = await bot.loop.run_in_executor(parse_executor, clear_holdings_log, HOLDINGS_LOG_CSV)
     await ctx.send(message if success else f"Failed to clear holdings log: {message}")
 
 
+# Shared scraper; runs are serialized because results are kept on the instance
+stock_split_scraper = None
+scraper_lock = asyncio.Lock()
+
+
+def get_scraper():
+    """Returns the shared StockSplitScraper, creating it on first use."""
+    global stock_split_scraper
+    if stock_split_scraper is None:
+        stock_split_scraper = StockSplitScraper()
+    return stock_split_scraper
+
+
 @bot.command(
     name="websearch",
     help=(
@@ -360,22 +559,24 @@ async def websearch(ctx, mode: str, *args):
         mode (str): The mode of operation ('search', 'report', 'custom').
         args (tuple): Additional arguments for the selected mode.
     """
-    scraper = StockSplitScraper()
-
-    if mode == "search" and args:
-        ticker = args[0]
-        await scraper.run(ctx, mode="search_ticker", ticker=ticker)
-    elif mode == "report":
-        await scraper.run(ctx, mode="weekly_report")
-    elif mode == "custom" and len(args) == 2:
-        start_date, end_date = args
-        await scraper.run(ctx, mode="custom_report", custom_dates=(start_date, end_date))
-    await ctx.send(
-        "Invalid usage. Try one of the following:\n"
-        "`..websearch search <ticker>`\n"
-        "`..websearch report`\n"
-        "`..websearch custom <start_date> <end_date>`"
-    )
+    scraper = get_scraper()
+
+    async with scraper_lock:
+        if mode == "search" and args:
+            ticker = args[0]
+            await scraper.run(ctx, mode="search_ticker", ticker=ticker)
+        elif mode == "report":
+            await scraper.run(ctx, mode="weekly_report")
+        elif mode == "custom" and len(args) == 2:
+            start_date, end_date = args
+            await scraper.run(ctx, mode="custom_report", custom_dates=(start_date, end_date))
+        else:
+            await ctx.send(
+                "Invalid usage. Try one of the following:\n"
+                "`..websearch search <ticker>`\n"
+                "`..websearch report`\n"
+                "`..websearch custom <start_date> <end_date>`"
+            )
 
 
 @bot.command(
@@ -388,34 +589,40 @@ async def websearch(ctx, mode: str, *args):
     )
 )
 async def rs_roundup(ctx, *args):
-    include_excerpt = "excerpt" in args
-    summary = "summary" in args
+    flags = frozenset(args)
+    include_excerpt = "excerpt" in flags
+    summary = "summary" in flags
 
     await ctx.send("Fetching filings, please wait...")
-    results = fetch_results(include_excerpt=include_excerpt)
+    results = await asyncio.to_thread(fetch_results, include_excerpt=include_excerpt)
 
     if isinstance(results, str):  # Check for error message
         await ctx.send(results)
     elif results:
         if summary:
+            forms, companies = set(), set()
+            for r in results:
+                forms.add(r['form_type'])
+                companies.add(r['company_name'])
             message = (
                 f"**Summary**:\n"
                 f"Total Results: {len(results)}\n"
-                f"Forms: {', '.join(set(r['form_type'] for r in results))}\n"
-                f"Companies: {', '.join(set(r['company_name'] for r in results))}\n"
+                f"Forms: {', '.join(forms)}\n"
+                f"Companies: {', '.join(companies)}\n"
             )
             await ctx.send(message)
         else:
+            # One embed per filing, packed several to a message
+            embeds = []
             for result in results:
-                message = (
-                    f"**Company**: {result['company_name']}\n"
-                    f"**Form Type**: {result['form_type']}\n"
-                    f"**Description**: {result['description']}\n"
-                    f"**File Date**: {result['file_date']}\n"
-                )
+                embed = Embed(title=str(result['company_name'])[:256])
+                embed.add_field(name="Form Type", value=result['form_type'] or "N/A", inline=True)
+                embed.add_field(name="File Date", value=result['file_date'] or "N/A", inline=True)
+                embed.add_field(name="Description", value=str(result['description'] or "N/A")[:1024], inline=False)
                 if include_excerpt:
-                    message += f"**Excerpt**: {result['excerpt']}\n"
-                await ctx.send(message)
+                    embed.add_field(name="Excerpt", value=str(result['excerpt'] or "N/A")[:1024], inline=False)
+                embeds.append(embed)
+            await send_embeds(ctx, embeds)
     else:
         await ctx.send("No relevant filings found.")
 
@@ -432,23 +639,28 @@ async def rs_roundup(ctx, *args):
 )
 async def query_table(ctx, table: str, *args):
     try:
-        results = bot_query_table(table, list(args))
+        results = await asyncio.to_thread(bot_query_table, table, list(args))
         if not results:
             await ctx.send(f"No results found for table `{table}` with the provided filters.")
             return
 
-        # Send results as a message
-        response = ""
-        for row in results:
-            response += "\n".join([f"{key}: {value}" for key, value in row.items()]) + "\n\n"
-        
-        # Send response (Discord limits messages to 2000 characters)
-        for chunk in [response[i:i+2000] for i in range(0, len(response), 2000)]:
-            await ctx.send(chunk)
+        # One embed per row, packed several to a message
+        embeds = [
+            Embed(
+                title=f"{table} #{index}",
+                description="\n".join(f"**{key}**: {value}" for key, value in row.items())[:4096],
+            )
+            for index, row in enumerate(results, start=1)
+        ]
+        await send_embeds(ctx, embeds)
     except Exception as e:
         await ctx.send(f"Error querying table `{table}`: {e}")
         
 
+# Field names of the negative holdings alert, in display order
+NEGATIVE_HOLDINGS_FIELDS = ("Stock", "Quantity", "Broker Name", "Broker Number", "Account Number")
+
+
 async def send_negative_holdings(quantity, stock, alert_type, broker_name, broker_number, account_number):
     """
     Sends an alert message to the target Discord channel for negative holdings.
@@ -466,29 +678,29 @@ async def send_negative_holdings(quantity, stock, alert_type, broker_name, broke
     """
     try:
         # Fetch the target channel
-        channel = bot.get_channel(TARGET_CHANNEL_ID)
+        channel = get_primary_channel()
 
         if channel:
-            # Build the embed message
-            embed = Embed(
-                title=f"Alert! {alert_type}",
-                description="A negative holdings quantity was detected.",
-                color=0xFF0000,
-            )
-            embed.add_field(name="Stock", value=stock, inline=True)
-            embed.add_field(name="Quantity", value=quantity, inline=True)
-            embed.add_field(name="Broker Name", value=broker_name, inline=True)
-            embed.add_field(name="Broker Number", value=broker_number, inline=True)
-            embed.add_field(name="Account Number", value=account_number, inline=True)
+            # Build the embed message from the fixed layout
+            values = (stock, quantity, broker_name, broker_number, account_number)
+            embed = Embed.from_dict({
+                "title": f"Alert! {alert_type}",
+                "description": "A negative holdings quantity was detected.",
+                "color": 0xFF0000,
+                "fields": [
+                    {"name": name, "value": str(value), "inline": True}
+                    for name, value in zip(NEGATIVE_HOLDINGS_FIELDS, values)
+                ],
+            })
 
             # Send the message
             await channel.send(embed=embed)
-            logging.info(f"Negative holdings alert sent for stock {stock}.")
+            logging.info("Negative holdings alert sent for stock %s.", stock)
         else:
-            logging.error(f"Target channel with ID {TARGET_CHANNEL_ID} not found.")
+            logging.error("Target channel with ID %s not found.", TARGET_CHANNEL_ID)
 
     except Exception as e:
-        logging.error(f"Error sending negative holdings alert: {e}")
+        logging.error("Error sending negative holdings alert: %s", e)
 
 
 @bot.command(
@@ -500,23 +712,67 @@ async def send_negative_holdings(quantity, stock, alert_type, broker_name, broke
 async def shutdown(ctx):
     await ctx.send("no you")
     logging.info("Shutdown from main. Deactivating.")
-    shutdown_handler(signal.SIGTERM, None)  # Manually call the handler
+    await shutdown_bot()
 
-# Graceful shutdown handler
+
+async def shutdown_bot():
+    """Stops background work and closes the Discord connection so bot.run returns."""
+    global shutting_down
+    if shutting_down:
+        return
+    shutting_down = True
+    logging.info("RSAssistant - shutting down...")
+    stop_background_tasks()
+    try:
+        await bot.close()
+    except Exception:
+        logging.exception("Error closing the Discord connection.")
+
+
+def request_shutdown():
+    """Signal callback that schedules shutdown_bot on the running loop."""
+    global shutdown_task
+    if shutdown_task is None:
+        shutdown_task = asyncio.create_task(shutdown_bot())
+
+
+# Graceful shutdown handler, used where the loop cannot own signals (Windows)
 def shutdown_handler(signal_received, frame):
+    global shutting_down
+    if shutting_down:
+        return
+    shutting_down = True
     logging.info("RSAssistant - shutting down...")
-    global periodic_check, reminder_scheduler
-    if periodic_check and not periodic_check.done():
-        periodic_check.cancel()
-    if reminder_scheduler:
-        reminder_scheduler.shutdown()
+    stop_background_tasks()
     sys.exit(0)
 
-signal.signal(signal.SIGINT, shutdown_handler)
-signal.signal(signal.SIGTERM, shutdown_handler)
+
+def install_signal_handlers(loop):
+    """Routes SIGINT and SIGTERM through the event loop so shutdown runs as a coroutine."""
+    global signal_handlers_installed
+    if signal_handlers_installed:
+        return
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_shutdown)
+        except NotImplementedError:
+            signal.signal(sig, shutdown_handler)
+    signal_handlers_installed = True
 
 
 
 # Start the bot with the token from the .env
 if __name__ == "__main__":
-    bot.run(BOT_TOKEN)  
+    setup_logging()
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logging.info("uvloop not available, using the default asyncio event loop.")
+    bot.run(BOT_TOKEN)
+    parse_executor.shutdown(wait=True)  # Let queued order writes finish
+
+    if restart_requested:
+        logging.info("Restarting RSAssistant...")
+        stop_logging()  # execv skips atexit, so flush queued log records first
+        os.execv(PYTHON_EXECUTABLE, RESTART_ARGV)
@@ -7,11 +7,13 @@ from selenium.webdriver.edge.options import Options
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
+import asyncio
 import logging
 
 class StockSplitScraper:
     def __init__(self):
         self.symbols_and_links = []
+        self.driver_path = None  # Resolved by webdriver_manager on first page load
         logging.basicConfig(level=logging.INFO)
 
     def get_week_dates(self):
@@ -28,7 +30,9 @@ class StockSplitScraper:
         options.add_argument("--log-level=3")
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
-        service = Service(EdgeChromiumDriverManager().install())
+        if self.driver_path is None:
+            self.driver_path = EdgeChromiumDriverManager().install()
+        service = Service(self.driver_path)
         driver = webdriver.Edge(service=service, options=options)
 
         try:
@@ -73,6 +77,56 @@ class StockSplitScraper:
             file.write(html)
         logging.info("Saved page source to debug_page.html.")
 
+    def scrape(self, mode, ticker=None, custom_dates=None):
+        """
+        Blocking scrape for the given mode. Returns a list of (symbol, link)
+        pairs, or None if the mode or its parameters are invalid.
+        """
+        if mode == "search_ticker" and ticker:
+            start_date, end_date = self.get_week_dates()
+            url = f"https://finance.yahoo.com/calendar/splits?from={start_date}&to={end_date}&day={start_date}"
+            html = self.get_page_content(url)
+            self.save_html_for_debugging(html)  # Save for debugging
+            self.parse_page_content(html)
+            return self.search_ticker(ticker)
+
+        elif mode == "weekly_report":
+            start_date, end_date = self.get_week_dates()
+            all_results = []
+            for day_offset in range(7):
+                current_date = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=day_offset)
+                url = f"https://finance.yahoo.com/calendar/splits?from={start_date}&to={end_date}&day={current_date.strftime('%Y-%m-%d')}"
+                html = self.get_page_content(url)
+                self.save_html_for_debugging(html)  # Save for debugging
+                self.parse_page_content(html)
+                all_results.extend(self.symbols_and_links)
+            return all_results
+
+        elif mode == "custom_report" and custom_dates:
+            start_date, end_date = custom_dates
+            url = f"https://finance.yahoo.com/calendar/splits?from={start_date}&to={end_date}"
+            html = self.get_page_content(url)
+            self.save_html_for_debugging(html)  # Save for debugging
+            self.parse_page_content(html)
+            return list(self.symbols_and_links)
+
+        return None
+
+    async def send_results_to_discord(self, ctx, results):
+        """Send (symbol, link) pairs to Discord, packing lines up to 2000 characters per message."""
+        if not results:
+            await ctx.send("No stock splits found.")
+            return
+
+        message = ""
+        for symbol, link in results:
+            line = f"**{symbol}**: <{link}>"
+            if message and len(message) + len(line) + 1 > 2000:
+                await ctx.send(message)
+                message = ""
+            message = f"{message}\n{line}" if message else line
+        await ctx.send(message)
+
     async def run(self, ctx, mode, ticker=None, custom_dates=None):
         """
         Run the scraper in different modes:
@@ -81,38 +135,12 @@ class StockSplitScraper:
         - custom_report: Fetch stock splits for a custom date range (optional).
         """
         try:
-            if mode == "search_ticker" and ticker:
-                start_date, end_date = self.get_week_dates()
-                url = f"https://finance.yahoo.com/calendar/splits?from={start_date}&to={end_date}&day={start_date}"
-                html = self.get_page_content(url)
-                self.save_html_for_debugging(html)  # Save for debugging
-                self.parse_page_content(html)
-                results = self.search_ticker(ticker)
-                await self.send_results_to_discord(ctx, results)
-
-            elif mode == "weekly_report":
-                start_date, end_date = self.get_week_dates()
-                all_results = []
-                for day_offset in range(7):
-                    current_date = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=day_offset)
-                    url = f"https://finance.yahoo.com/calendar/splits?from={start_date}&to={end_date}&day={current_date.strftime('%Y-%m-%d')}"
-                    html = self.get_page_content(url)
-                    self.save_html_for_debugging(html)  # Save for debugging
-                    self.parse_page_content(html)
-                    all_results.extend(self.symbols_and_links)
-
-                await self.send_results_to_discord(ctx, all_results)
-
-            elif mode == "custom_report" and custom_dates:
-                start_date, end_date = custom_dates
-                url = f"https://finance.yahoo.com/calendar/splits?from={start_date}&to={end_date}"
-                html = self.get_page_content(url)
-                self.save_html_for_debugging(html)  # Save for debugging
-                self.parse_page_content(html)
-                await self.send_results_to_discord(ctx, self.symbols_and_links)
-
-            else:
+            # Selenium calls block; scrape in a worker thread so the event loop keeps running
+            results = await asyncio.to_thread(self.scrape, mode, ticker, custom_dates)
+            if results is None:
                 await ctx.send("Invalid mode or missing parameters. Use 'search_ticker', 'weekly_report', or 'custom_report'.")
+            else:
+                await self.send_results_to_discord(ctx, results)
         except Exception as e:
             logging.error(f"Error in StockSplitScraper.run: {e}")
             await ctx.send("An error occurred while processing your request.")
@@ -1,7 +1,9 @@
+import functools
 import os
 import logging
 import yaml
 import json
+import orjson
 from pathlib import Path
 import dotenv
 from utils.logging_setup import setup_logging
@@ -10,9 +12,6 @@ from utils.logging_setup import setup_logging
 ENV_PATH = 'config/.env'
 DEFAULT_CONFIG_PATH = 'config/settings.yaml'
 
-# Cache for loaded configuration
-_config_cache = None
-
 # Dynamically resolve base directory (inside Docker or outside)
 def get_base_dir():
     logging.debug("Determining the base directory...")
@@ -73,33 +72,22 @@ def initialize_config(config_path=DEFAULT_CONFIG_PATH):
     logging.info(f"Config file found: {config_file}")
     return config_file
 
+@functools.lru_cache(maxsize=1)
 def load_config(config_path=DEFAULT_CONFIG_PATH):
     """
     Load the YAML configuration file once and cache it.
     """
-    global _config_cache
-    if _config_cache is not None:
-        logging.debug("Returning cached configuration")
-        return _config_cache
-
     logging.debug(f"Loading configuration from {config_path}")
     config_file = initialize_config(config_path)
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
-            _config_cache = yaml.safe_load(f)
+            config = yaml.safe_load(f)
             logging.info(f"Configuration loaded from {config_file}")
-            return _config_cache
+            return config
     except yaml.YAMLError as e:
         logging.error(f"Error parsing YAML config: {e}")
         raise
 
-# Paths
-ENV_PATH = 'config/.env'
-DEFAULT_CONFIG_PATH = 'config/settings.yaml'
-
-# Cache for loaded configuration
-_config_cache = None
-
 # Resolved Paths
 DISCORD_PRIMARY_CHANNEL = None
 DISCORD_PRIMARY_CHANNEL = None
@@ -114,7 +102,7 @@ VERSION = None
 
 # Logging the environment variable loading
 DISCORD_TOKEN = os.getenv("BOT_TOKEN")
-logging.info(f"Loaded BOT_TOKEN: {DISCORD_TOKEN}")
+logging.info("Loaded BOT_TOKEN: %s", "set" if DISCORD_TOKEN else "missing")
 
 # Pre-resolve paths for shared use
 logging.debug("Loading configuration and resolving paths...")
@@ -139,6 +127,9 @@ logging.info(f"Resolved DATABASE_FILE: {SQL_DATABASE_DB}")
 logging.info(f"Resolved ERROR_LOG: {ERROR_LOG_FILE}")
 logging.info(f"Resolved WATCH_FILE: {WATCH_FILE}")
 
+# Parsed account mappings keyed by file path, reused while the file's mtime is unchanged
+_mapping_cache = {}
+
 def load_account_mappings(file=ACCOUNT_MAPPING_FILE):
     """Loads account mappings from the JSON file and ensures the data structure is valid."""
     logging.debug(f"Loading account mappings from {file}")
@@ -147,8 +138,8 @@ def load_account_mappings(file=ACCOUNT_MAPPING_FILE):
         return {}
 
     try:
-        with open(file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file, "rb") as f:
+            data = orjson.loads(f.read())
             logging.debug(f"Account mapping data loaded successfully.")
             if not isinstance(data, dict):
                 logging.error(f"Invalid account mapping structure in {file}. Expected a dictionary.")
@@ -170,6 +161,25 @@ def load_account_mappings(file=ACCOUNT_MAPPING_FILE):
         logging.error(f"Error decoding JSON from {file}: {e}")
         return {}
 
+def load_account_mappings_cached(file=ACCOUNT_MAPPING_FILE):
+    """
+    Returns the parsed account mappings, re-reading the file only when its
+    modification time changes. The returned dict is shared; do not mutate it.
+    """
+    try:
+        mtime = os.stat(file).st_mtime_ns
+    except OSError:
+        _mapping_cache.pop(file, None)
+        return load_account_mappings(file)
+
+    cached = _mapping_cache.get(file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    data = load_account_mappings(file)
+    _mapping_cache[file] = (mtime, data)
+    return data
+
 def save_account_mappings(mappings):
     """Save the account mappings to the JSON file."""
     logging.debug(f"Saving account mappings to {ACCOUNT_MAPPING_FILE}")
@@ -183,7 +193,7 @@ def get_account_nickname(broker, group_number, account_number):
     or returns the account number if the mapping is not found.
     """
     logging.debug(f"Retrieving nickname for broker: {broker}, group: {group_number}, account: {account_number}")
-    account_mapping = load_account_mappings(ACCOUNT_MAPPING_FILE)
+    account_mapping = load_account_mappings_cached(ACCOUNT_MAPPING_FILE)
 
     account_number_str = str(account_number)
     group_number_str = str(group_number)
@@ -199,6 +209,28 @@ def get_account_nickname(broker, group_number, account_number):
     return nickname
 
 
+def index_account_mappings(mappings):
+    """
+    Flattens the nested broker -> group -> account mapping into lookup tables.
+    Build it from the live mapping per call, since ..loadmap updates it in place.
+
+    Returns:
+        tuple: (nicknames keyed by (broker, account) using the first group found,
+                list of (group, account, nickname) per broker)
+    """
+    nicknames_by_account = {}
+    broker_accounts = {}
+    for broker, groups in mappings.items():
+        if not isinstance(groups, dict):
+            continue
+        entries = broker_accounts.setdefault(broker, [])
+        for group, accounts in groups.items():
+            for account, nickname in accounts.items():
+                nicknames_by_account.setdefault((broker, account), nickname)
+                entries.append((group, account, nickname))
+    return nicknames_by_account, broker_accounts
+
+
 ACCOUNT_MAPPING = load_account_mappings(file=ACCOUNT_MAPPING_FILE)
 logging.info(f"Resolved ACCOUNT_MAPPING_FILE: {ACCOUNT_MAPPING_FILE}")
 
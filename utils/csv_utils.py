@@ -1,9 +1,10 @@
+import asyncio
 import csv
 import logging
 import os
-from collections import defaultdict
 from datetime import datetime, timedelta
 
+import pandas as pd
 import yfinance as yf
 import discord
 from discord import Embed
@@ -162,8 +163,6 @@ def save_order_to_csv(order_data):
 
 # ! --- Holdings Management ---
 
-ALL_HOLDINGS_CURRENT = load_csv_log(HOLDINGS_LOG_CSV)
-
 def save_holdings_to_csv(parsed_holdings):
     """Saves holdings data to CSV, ensuring no duplicates are saved, quantities are valid floats, and a timestamp is added."""
 
@@ -232,12 +231,15 @@ def save_holdings_to_csv(parsed_holdings):
 
         # Write updated holdings list back to the CSV
         if new_holdings:  # Proceed only if there are new holdings to add
-            with open(HOLDINGS_LOG_CSV, mode="w", newline="") as file:
+            # Replace the file atomically so readers on the event loop never see a partial log
+            temp_path = f"{HOLDINGS_LOG_CSV}.tmp"
+            with open(temp_path, mode="w", newline="") as file:
                 writer = csv.DictWriter(file, fieldnames=HOLDINGS_HEADERS)
                 writer.writeheader()  # Ensure headers are written
                 writer.writerows(
                     existing_holdings + new_holdings
                 )  # Write the combined list
+            os.replace(temp_path, HOLDINGS_LOG_CSV)
 
             logging.info(f"Holdings saved, with {len(new_holdings)} new entries added.")
         else:
@@ -264,9 +266,11 @@ def clear_holdings_log(filename):
 
         if headers:
             # Write only the headers back to the file, clearing the data
-            with open(filename, mode="w", newline="") as file:
+            temp_path = f"{filename}.tmp"
+            with open(temp_path, mode="w", newline="") as file:
                 writer = csv.writer(file)
                 writer.writerow(headers)  # Write the headers back
+            os.replace(temp_path, filename)
             return (
                 True,
                 f'Holdings at: "{filename}" has been cleared. Run `!rsa holdings` to repopulate.',
@@ -291,60 +295,47 @@ def get_top_holdings(range=3):
     """
     logging.info(f"Starting aggregation of top holdings for range: {range}")
 
-    broker_data = defaultdict(list)
-    latest_timestamp = None
-
     try:
-        # Filter holdings where Quantity <= 1 and group by broker
-        filtered_holdings = []
-        for holding in ALL_HOLDINGS_CURRENT:
-            try:
-                quantity = float(holding.get("Quantity", 0))
-                if quantity <= 1:
-                    filtered_holdings.append(holding)
-                    # Update the latest timestamp
-                    timestamp = holding.get("Timestamp")
-                    if timestamp:
-                        parsed_timestamp = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                        if not latest_timestamp or parsed_timestamp > latest_timestamp:
-                            latest_timestamp = parsed_timestamp
-            except ValueError:
-                logging.warning(f"Skipping invalid Quantity value: {holding.get('Quantity')} in holding: {holding}")
-                continue
-
-        logging.debug(f"Filtered {len(filtered_holdings)} holdings where Quantity <= 1.")
-
-        # Group by broker while ensuring distinct tickers
-        for holding in filtered_holdings:
-            broker_name = holding.get("Broker Name")
-            stock_ticker = holding.get("Stock")  # Stock ticker to check uniqueness
-            if stock_ticker == "Cash and Sweep Funds":
-                continue
-            if broker_name and stock_ticker:
-                # Ensure no duplicates of the same stock ticker for the broker
-                existing_tickers = {h.get("Stock") for h in broker_data[broker_name]}
-                if stock_ticker not in existing_tickers:
-                    broker_data[broker_name].append(holding)
-                    logging.debug(f"Added distinct holding for broker '{broker_name}': {holding}")
-                    print(f"Added distinct holding for broker '{broker_name}': {holding}")
-
-        # Sort and take the top X (range) for each broker
-        top_range = {}
-        for broker, holdings_list in broker_data.items():
-            sorted_holdings = sorted(
-                holdings_list,
-                key=lambda x: float(x.get("Position Value", 0)),
-                reverse=True
-            )[:range]
-            top_range[broker] = sorted_holdings
-            logging.info(f"Top {range} distinct holdings for broker '{broker}': {sorted_holdings}")
-
-        logging.info("Completed aggregation of top holdings.")
-        return top_range, latest_timestamp
-
-    except Exception as e:
+        # Read the current holdings log; only the columns used below are parsed
+        holdings = pd.read_csv(
+            HOLDINGS_LOG_CSV,
+            usecols=["Broker Name", "Stock", "Quantity", "Position Value", "Timestamp"],
+            dtype={"Broker Name": str, "Stock": str, "Timestamp": str},
+        )
+    except (FileNotFoundError, pd.errors.EmptyDataError) as e:
+        logging.warning(f"No holdings available for top holdings: {e}")
+        return {}, None
+    except ValueError as e:
         logging.error(f"Error in get_top_holdings: {e}", exc_info=True)
-        return {}
+        return {}, None
+
+    # Filter holdings where Quantity <= 1; invalid quantities become NaN and are dropped
+    holdings["Quantity"] = pd.to_numeric(holdings["Quantity"], errors="coerce")
+    holdings["Position Value"] = pd.to_numeric(holdings["Position Value"], errors="coerce").fillna(0)
+    holdings = holdings[holdings["Quantity"] <= 1]
+    logging.debug(f"Filtered {len(holdings)} holdings where Quantity <= 1.")
+
+    latest = pd.to_datetime(holdings["Timestamp"], format="%Y-%m-%d %H:%M:%S", errors="coerce").max()
+    latest_timestamp = None if pd.isna(latest) else latest.to_pydatetime()
+
+    # Group by broker while ensuring distinct tickers (first entry wins)
+    holdings = holdings.dropna(subset=["Broker Name", "Stock"])
+    holdings = holdings[holdings["Stock"] != "Cash and Sweep Funds"]
+    holdings = holdings.drop_duplicates(subset=["Broker Name", "Stock"], keep="first")
+
+    # Sort and take the top X (range) for each broker, keeping brokers in log order
+    top = (
+        holdings.sort_values("Position Value", ascending=False, kind="stable")
+        .groupby("Broker Name", sort=False)
+        .head(range)
+    )
+    grouped = {broker: group.to_dict("records") for broker, group in top.groupby("Broker Name", sort=False)}
+    top_range = {broker: grouped.get(broker, []) for broker in holdings["Broker Name"].unique()}
+    for broker, top_holdings in top_range.items():
+        logging.info(f"Top {range} distinct holdings for broker '{broker}': {top_holdings}")
+
+    logging.info("Completed aggregation of top holdings.")
+    return top_range, latest_timestamp
 
 
 async def send_top_holdings_embed(ctx, range):
@@ -358,8 +349,8 @@ async def send_top_holdings_embed(ctx, range):
     try:
         logging.info(f"Preparing to send top holdings embed for range: {range}")
 
-        # Get top holdings and latest timestamp
-        top_holdings, latest_timestamp = get_top_holdings(range)
+        # Get top holdings and latest timestamp; reading the log blocks, so keep it off the loop
+        top_holdings, latest_timestamp = await asyncio.to_thread(get_top_holdings, range)
 
         if not top_holdings:
             logging.warning("No holdings found to display.")
@@ -1,10 +1,22 @@
+import atexit
 import logging
+import queue
 import sys
 import os
 import time
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from colorama import Fore, Style
 
+# Writes queued records to the real handlers on a background thread
+_listener = None
+
+def stop_logging():
+    """Flushes and stops the log listener thread, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 class ReplaceInvalidCharactersFilter(logging.Filter):
     """
     A logging filter to replace invalid characters (e.g., emojis) in log messages.
@@ -67,11 +79,23 @@ def setup_logging(config=None, verbose=False):
         handler.addFilter(filter_invalid_chars)
 
 
+    # Callers only enqueue records; file and console writes happen on the listener thread
+    global _listener
+    stop_logging()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+    # Only the listener's handlers add the timestamp/level prefix
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Configure logging
     logging.basicConfig(
         level=getattr(logging, log_level, logging.INFO),
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[handler, console_handler],
+        handlers=[queue_handler],
     )
 
     # Suppress third-party logs
@@ -107,14 +131,14 @@ def setup_logging(config=None, verbose=False):
         def filter(self, record):
             current_time = time.time()
 
-            # Handle unhashable messages
-            try:
-                msg_key = hash(record.msg)
-            except TypeError:  # Handle unhashable messages like lists or dicts
-                if isinstance(record.msg, (list, dict)):
-                    self.log_sample(record.msg, label="Unhashable message logged")
-                    return False  # Skip logging the original message
-                msg_key = id(record.msg)
+            # Handle unhashable messages like lists or dicts
+            if isinstance(record.msg, (list, dict)):
+                self.log_sample(record.msg, label="Unhashable message logged")
+                return False  # Skip logging the original message
+
+            # Key on the formatted message so lazy %s arguments are told apart
+            message = record.getMessage()
+            msg_key = hash(message)
 
             # Deduplication check
             if msg_key in self.logged_messages:
@@ -123,7 +147,8 @@ def setup_logging(config=None, verbose=False):
                     return False
 
             # Truncate long messages
-            record.msg = self.truncate_message(record.msg)
+            record.msg = self.truncate_message(message)
+            record.args = None
             self.logged_messages[msg_key] = current_time
             return True
 
@@ -57,6 +57,11 @@ order_patterns = {
     },
 }
 
+# Nasdaq corporate actions alert: "📰 | <title> (<ticker>) <url>"
+# Tolerates extra spaces or blank lines between the title and the URL
+ALERT_MARKER = "📰 |"
+ALERT_PATTERN = re.compile(r"📰 \| (.+?) \((\w+)\)\s*(https?://[^\s]+)", re.ASCII)
+
 # Chapt Complete Orders Main
 def parse_order_message(content):
     """Parses incoming messages and routes them to the correct handler based on type."""
@@ -766,9 +771,8 @@ def alert_channel_message(content):
     Returns:
         str: A formatted alert message or None if no match is found.
     """
-    # Updated regex to handle extra spaces or blank lines
-    alert_pattern = r"📰 \| (.+?) \((\w+)\)\s*(https?://[^\s]+)"
-    match = re.search(alert_pattern, content)
+    # Cheap substring test first; most messages are not alerts at all
+    match = ALERT_PATTERN.search(content) if ALERT_MARKER in content else None
 
     if match:
         title = match.group(1)  # Extract the full title
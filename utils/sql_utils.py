@@ -1,24 +1,34 @@
 import logging
 import os
 import sqlite3
+import threading
 import uuid
 from datetime import datetime
 
-from utils.config_utils import SQL_DATABASE_DB, load_config, setup_logging
+from utils.config_utils import SQL_DATABASE_DB, load_config
 
 # Config and setup
 config = load_config()
-setup_logging()
 
 DB_FILE = SQL_DATABASE_DB # config.get("paths", {}).get("database", "volumes/db/reverse_splits.db")
 os.makedirs(os.path.dirname(DB_FILE), exist_ok=True)
 
 
+# Connections are opened once per thread and reused for every query
+_thread_local = threading.local()
+
+
 # Database connection helper
 def get_db_connection():
-    """Helper function to get a database connection."""
-    conn = sqlite3.connect(DB_FILE, timeout=30)  # Extend timeout to avoid lock errors
-    conn.execute("PRAGMA journal_mode=WAL;")  # Enable WAL mode for better concurrency
+    """Helper function to get the calling thread's persistent database connection."""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_FILE, timeout=30)  # Extend timeout to avoid lock errors
+        conn.execute("PRAGMA journal_mode=WAL;")  # Enable WAL mode for better concurrency
+        conn.execute("PRAGMA synchronous=NORMAL;")  # Safe with WAL, fewer fsyncs per commit
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA mmap_size=268435456;")
+        _thread_local.conn = conn
     return conn
 
 
@@ -72,6 +82,18 @@ def init_db():
             average_price REAL NOT NULL,
             FOREIGN KEY (account_id) REFERENCES AccountMappings(account_id)
         );
+
+        -- get_account_id: WHERE broker = ? AND broker_number = ? AND account_number = ?
+        CREATE INDEX IF NOT EXISTS idx_account_mappings_lookup
+            ON AccountMappings (broker, broker_number, account_number);
+
+        -- add_or_update_holding: WHERE account_id = ? AND ticker = ?
+        CREATE INDEX IF NOT EXISTS idx_holdings_account_ticker
+            ON Holdings (account_id, ticker);
+
+        -- No query reads these; drop them where an earlier version created them
+        DROP INDEX IF EXISTS idx_orders_ticker_date;
+        DROP INDEX IF EXISTS idx_historical_holdings_account_ticker_date;
         """
         )
         conn.commit()
@@ -375,7 +397,8 @@ def get_table_data(table_name, filters=None, limit=None):
                 params = list(filters.values())
 
             if limit:
-                query += f" LIMIT {limit}"
+                query += " LIMIT ?"
+                params.append(limit)
 
             cursor.execute(query, params)
             columns = [column[0] for column in cursor.description]
@@ -408,8 +431,18 @@ def bot_query_table(table_name, args):
     Raises:
         Exception: For invalid input or database errors.
     """
-    filters = {arg.split("=")[0]: arg.split("=")[1] for arg in args if "=" in arg}
-    limit = next((int(arg.split("=")[1]) for arg in args if arg.startswith("limit=")), None)
+    filters = {}
+    limit = None
+    for arg in args:
+        key, sep, value = arg.partition("=")
+        if not sep:
+            continue
+        if key == "limit":
+            if not value.isdecimal() or int(value) < 1:
+                raise ValueError(f"limit must be a positive integer, got '{value}'.")
+            limit = int(value)
+        else:
+            filters[key] = value
     return get_table_data(table_name, filters, limit)
 
 
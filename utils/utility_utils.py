@@ -13,7 +13,8 @@ import yfinance as yf
 
 from utils.config_utils import (
     load_config, get_account_nickname, load_account_mappings,
-    HOLDINGS_LOG_CSV, ORDERS_LOG_CSV, ACCOUNT_MAPPING, ACCOUNT_MAPPING_FILE
+    HOLDINGS_LOG_CSV, ORDERS_LOG_CSV, ACCOUNT_MAPPING, ACCOUNT_MAPPING_FILE,
+    index_account_mappings
 )
 
 # Load configuration and holdings data
@@ -545,6 +546,7 @@ def all_brokers_summary_by_owner(specific_broker=None):
         print(f"{broker}: {broker_data}")
 
     processed_accounts = set()  # Track processed accounts to avoid duplicates
+    nicknames_by_account, _ = index_account_mappings(ACCOUNT_MAPPING)
 
     with open(HOLDINGS_LOG_CSV, newline="") as csvfile:
         reader = csv.DictReader(csvfile)
@@ -578,12 +580,7 @@ def all_brokers_summary_by_owner(specific_broker=None):
             #    f"\nProcessing Broker: {broker_name}, Account Number: {account_number}"
             # )
 
-            nickname = ""
-            if broker_name in ACCOUNT_MAPPING:
-                for broker_number, accounts in ACCOUNT_MAPPING[broker_name].items():
-                    if account_number in accounts:
-                        nickname = accounts[account_number]
-                        break
+            nickname = nicknames_by_account.get((broker_name, account_number), "")
 
             print(f"Fetched Nickname: '{nickname}'")
 
@@ -632,6 +629,7 @@ def generate_broker_summary_embed(ctx, specific_broker=None):
         discord.Embed: The generated embed with summaries by account owner.
     """
     brokers_summary = all_brokers_summary_by_owner(specific_broker=None)
+    _, broker_accounts = index_account_mappings(ACCOUNT_MAPPING)
     if specific_broker:
         broker = (
             specific_broker.upper()
@@ -646,10 +644,7 @@ def generate_broker_summary_embed(ctx, specific_broker=None):
 
     for broker, owner_totals in brokers_summary.items():
         # Calculate the total number of accounts for the broker
-        account_owner_count = sum(
-            len(accounts)
-            for broker_number, accounts in ACCOUNT_MAPPING.get(broker, {}).items()
-        )
+        account_owner_count = len(broker_accounts.get(broker, ()))
 
         broker_total = sum(owner_totals.values())  # Calculate the total holdings for the broker
 
@@ -754,6 +749,23 @@ async def send_large_message_chunks(ctx, message):
     if current_chunk:
         await ctx.send(current_chunk)
 
+async def send_embeds(ctx, embeds):
+    """
+    Sends embeds in as few messages as Discord allows:
+    up to 10 embeds and 6000 characters of embed text per message.
+    """
+    batch, size = [], 0
+    for embed in embeds:
+        length = len(embed)
+        if batch and (len(batch) == 10 or size + length > 6000):
+            await ctx.send(embeds=batch)
+            batch, size = [], 0
+        batch.append(embed)
+        size += length
+
+    if batch:
+        await ctx.send(embeds=batch)
+
 def get_order_details(broker, account_number, ticker):
     """# Search orders_log.csv for matching broker, account, and stock ticker.
     try:
@@ -1,19 +1,21 @@
 import asyncio
+import calendar
 import csv
 import json
 import logging
 import os
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime
 
 import discord
+import orjson
 import pandas as pd
 
 from utils.config_utils import (
     load_account_mappings, load_config,
     WATCH_FILE
 )
-from utils.utility_utils import send_large_message_chunks, get_last_stock_price
+from utils.utility_utils import send_embeds, send_large_message_chunks, get_last_stock_price
 from utils.excel_utils import add_stock_to_excel_log
 
 
@@ -33,10 +35,12 @@ class WatchListManager:
         self.load_watch_list()
 
     def save_watch_list(self):
-        """Save the current watch list to a JSON file."""
+        """Save the current watch list to a JSON file, replacing it atomically."""
+        temp_path = f"{self.file_path}.tmp"
         try:
-            with open(self.file_path, "w") as file:
-                json.dump(self.watch_list, file, default=str)
+            with open(temp_path, "wb") as file:
+                file.write(orjson.dumps(self.watch_list, default=str))
+            os.replace(temp_path, self.file_path)
             logging.info("Watch list saved.")
         except Exception as e:
             logging.error(f"Failed to save watch list: {e}")
@@ -45,8 +49,8 @@ class WatchListManager:
         """Load the watch list from a JSON file."""
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, "r") as file:
-                    self.watch_list = json.load(file)
+                with open(self.file_path, "rb") as file:
+                    self.watch_list = orjson.loads(file.read())
                 logging.info("Watch list loaded.")
             except (IOError, json.JSONDecodeError) as e:
                 logging.error(f"Failed to load watch list: {e}")
@@ -85,8 +89,6 @@ watch_list_manager = WatchListManager(WATCH_FILE)
 # Main functions
 async def watch_ticker(ctx, ticker: str, split_date: str, split_ratio: str = None):
     """Add a stock ticker with a split date and optional split ratio to the watch list."""
-    ticker = ticker.upper()
-
     if not watch_list_manager.ticker_exists(ticker):
         watch_list_manager.add_ticker(ticker, split_date, split_ratio or "N/A")
         try:
@@ -107,15 +109,13 @@ async def watch_ticker(ctx, ticker: str, split_date: str, split_ratio: str = Non
     await ctx.send(confirmation_message)
 
 async def watch_ratio(ctx, ticker: str, split_ratio: str):
-    ticker = ticker.upper()
-
     if not watch_list_manager.ticker_exists(ticker):
         await ctx.send(
             f"{ticker} is not currently in the watchlist. Use '..watch TICKER mm/dd [optional ratio]' to add it first."
         )
         return
 
-    if not split_ratio.count("-") == 1:
+    if not is_valid_split_ratio(split_ratio):
         await ctx.send("Invalid split ratio format. Use 'X-Y' format (e.g., 1-10).")
         return
 
@@ -160,23 +160,33 @@ async def list_watched_tickers(ctx):
     if not watch_list:
         await ctx.send("No tickers are being watched.")
     else:
-        embed = discord.Embed(
-            title="Watchlist",
-            description="All tickers and split dates:",
-            color=discord.Color.blue(),
-        )
+        # Price lookups are network calls; run them off the event loop in one worker
+        entries = list(watch_list.items())
+        prices = await asyncio.to_thread(lambda: [get_last_stock_price(ticker) for ticker, _ in entries])
 
-        for ticker, data in watch_list.items():
+        lines = []
+        for (ticker, data), last_price in zip(entries, prices):
             split_date = data.get("split_date", "N/A")
-            last_price = get_last_stock_price(ticker)
             last_price_display = f"{last_price:.2f}" if last_price is not None else "N/A"
-            embed.add_field(
-                name=f"{ticker} **|** ${last_price_display}",
-                value=f" **|** Split Date: {split_date} \n",
-                inline=True,
-            )
+            lines.append(f"**{ticker}** | ${last_price_display} | Split Date: {split_date}")
+
+        # One description per embed instead of a field per ticker (4096 character limit)
+        descriptions = ["All tickers and split dates:"]
+        for line in lines:
+            if len(descriptions[-1]) + len(line) + 1 > 4096:
+                descriptions.append(line)
+            else:
+                descriptions[-1] += f"\n{line}"
 
-        await ctx.send(embed=embed)
+        embeds = [
+            discord.Embed(
+                title="Watchlist" if index == 0 else "Watchlist (continued)",
+                description=description,
+                color=discord.Color.blue(),
+            )
+            for index, description in enumerate(descriptions)
+        ]
+        await send_embeds(ctx, embeds)
 
 async def send_reminder_message_embed(ctx):
     """Sends a reminder message with upcoming split dates in an embed."""
@@ -219,107 +229,47 @@ async def send_reminder_message_embed(ctx):
     await ctx.send(embed=embed)
 
 
-def get_seconds_until_next_reminder(target_hour, target_minute):
-    """Calculate the number of seconds until the next occurrence of a specific time (HH:MM)."""
-    now = datetime.now()
-    target_time = now.replace(
-        hour=target_hour, minute=target_minute, second=0, microsecond=0
-    )
-
-    if now > target_time:
-        # If the target time has already passed today, schedule it for tomorrow
-        target_time += timedelta(days=1)
+def parse_split_date(split_date_str):
+    """Parse an 'mm/dd' split date into a (month, day) tuple, or None if invalid."""
+    month, sep, day = split_date_str.partition("/")
+    if not (sep and month.isdecimal() and day.isdecimal()):
+        return None
+    month, day = int(month), int(day)
+    # Check against a leap year so 2/29 is accepted but 2/30 and 4/31 are not
+    if not (1 <= month <= 12 and 1 <= day <= calendar.monthrange(2000, month)[1]):
+        return None
+    return month, day
 
-    return (target_time - now).total_seconds()
 
+def split_date_in_year(year, month, day):
+    """Return the split date in the given year, moving 2/29 to 2/28 in non-leap years."""
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
 
-async def periodic_check(bot):
-    """Checks watchlist and sends reminders at 9:15 AM and 3:45 PM."""
-    while True:
-        now = datetime.now()
 
-        # Wait until 9:15 AM for the first reminder
-        if now.hour < 9 or (now.hour == 9 and now.minute < 15):
-            seconds_until_915 = get_seconds_until_next_reminder(9, 15)
-            await asyncio.sleep(seconds_until_915)
-            await send_reminder_message(bot)
-
-        # Wait until 3:45 PM for the next reminder
-        seconds_until_345 = get_seconds_until_next_reminder(16, 15)
-        # seconds_until_345 = get_seconds_until_next_reminder(15, 45)
-        await asyncio.sleep(seconds_until_345)
-        await send_reminder_message(bot)
-
-        # After 3:45 PM, calculate how long until 9:15 AM the next day
-        seconds_until_next_day = get_seconds_until_next_reminder(9, 15)
-        await asyncio.sleep(seconds_until_next_day)
+def is_valid_split_ratio(split_ratio):
+    """Check that a split ratio has the 'X-Y' form with whole numbers on both sides."""
+    old, sep, new = split_ratio.partition("-")
+    return bool(sep) and old.isdecimal() and new.isdecimal()
 
 
 def calculate_days_left(split_date_str):
     # Regular function, no await needed
     today = datetime.now().date()
-    split_date = (
-        datetime.strptime(split_date_str, "%m/%d").replace(year=today.year).date()
-    )
+    month_day = parse_split_date(split_date_str)
+    if month_day is None:
+        raise ValueError(f"Invalid split date '{split_date_str}', expected mm/dd.")
+    split_date = split_date_in_year(today.year, *month_day)
     if split_date < today:
-        split_date = split_date.replace(year=today.year + 1)
+        split_date = split_date_in_year(today.year + 1, *month_day)
     days_left = (split_date - today).days
     return days_left
 
 
 async def stop_watching(ctx, ticker: str):
     """Stop watching a stock ticker across all accounts."""
-    ticker = ticker.upper()
-
     if watch_list_manager.remove_ticker(ticker):
         await ctx.send(f"Stopped watching {ticker} across all accounts.")
         logging.info(f"Stopped watching {ticker}.")
     else:
         await ctx.send(f"{ticker} is not being watched.")
         logging.info(f"{ticker} was not being watched.")
-
-
-
-async def send_reminder_message(bot):
-    """Sends a reminder message with upcoming split dates in the specified channel."""
-    # Create the embed message
-    embed = discord.Embed(
-        title="**Watchlist - Upcoming Split Dates: **",
-        description=" ",
-        color=discord.Color.blue(),
-    )
-
-    # Get the watch list from the manager
-    watch_list = watch_list_manager.get_watch_list()
-
-    # Prepare a list to store tickers and their days left until the split
-    sorted_tickers = []
-
-    # Add each ticker and its days left as a field in the embed
-    for ticker, data in watch_list.items():
-        split_date_str = data["split_date"]
-        days_left = calculate_days_left(split_date_str)
-
-        # Only include stocks with split dates within 21 days
-        if days_left <= 21:
-            sorted_tickers.append((days_left, ticker, split_date_str))
-
-    # Sort the list by days_left (first element of the tuple)
-    sorted_tickers.sort(key=lambda x: x[0])
-
-    # Add the sorted tickers to the embed
-    for days_left, ticker, split_date_str in sorted_tickers:
-        embed.add_field(
-            name=f"**| {ticker}** - Effective on {split_date_str}",
-            value=f"*|>* Must purchase within **{days_left}** day(s).\n",
-            inline=False,
-        )
-
-    embed.set_footer(text="Automated message will repeat.")
-
-    # Send the embed message to the specified channel
-    channel = bot.get_channel(TARGET_CHANNEL_ID)  # Replace with correct channel ID
-    if channel:
-        await channel.send(embed=embed)
-    else:
-        logging.error("Channel not found.")